@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 """Train Glow TTS model."""
 
+import contextlib
+import functools
+import math
+import multiprocessing
 import os
 import sys
 import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from random import randrange
 
 import torch
@@ -17,21 +22,20 @@ from torch.utils.data.distributed import DistributedSampler
 from TTS.tts.datasets.preprocess import load_meta_data
 from TTS.tts.datasets.TTSDataset import MyDataset
 from TTS.tts.layers.losses import GlowTTSLoss
+from TTS.tts.utils.data import collate_glow_tts
 from TTS.tts.utils.generic_utils import setup_model
-from TTS.tts.utils.io import save_best_model, save_checkpoint
+from TTS.tts.utils.io import copy_state_dict_to_cpu, save_best_model, save_checkpoint
 from TTS.tts.utils.measures import alignment_diagonal_score
 from TTS.tts.utils.speakers import parse_speakers
-from TTS.tts.utils.synthesis import synthesis
+from TTS.tts.utils.synthesis import griffin_lim_worker, init_griffin_lim_worker, synthesis
 from TTS.tts.utils.text.symbols import make_symbols, phonemes, symbols
 from TTS.tts.utils.visual import plot_alignment, plot_spectrogram
 from TTS.utils.arguments import init_training
 from TTS.utils.audio import AudioProcessor
-from TTS.utils.distribute import init_distributed, reduce_tensor
+from TTS.utils.distribute import init_distributed, reduce_tensors
 from TTS.utils.generic_utils import KeepAverage, count_parameters, remove_experiment_folder, set_init_dict
 from TTS.utils.radam import RAdam
-from TTS.utils.training import NoamLR, setup_torch_training_env
-
-use_cuda, num_gpus = setup_torch_training_env(True, False)
+from TTS.utils.training import CUDAPrefetcher, NoamLR, setup_torch_training_env
 
 
 def setup_loader(ap, r, is_val=False, verbose=False):
@@ -62,19 +66,40 @@ def setup_loader(ap, r, is_val=False, verbose=False):
 
         if config.use_phonemes and config.compute_input_seq_cache:
             # precompute phonemes to have a better estimate of sequence lengths.
+            # rank 0 fills the phoneme cache first so that the other ranks only load it.
+            if num_gpus > 1 and args.rank != 0:
+                torch.distributed.barrier()
             dataset.compute_input_seq(config.num_loader_workers)
+            if num_gpus > 1 and args.rank == 0:
+                torch.distributed.barrier()
         dataset.sort_items()
 
-        sampler = DistributedSampler(dataset) if num_gpus > 1 else None
+        # look up the speaker ids on the loader workers instead of the training loop
+        use_speaker_ids = config.use_speaker_embedding and not config.use_external_speaker_embedding_file
+        collate_fn = functools.partial(
+            collate_glow_tts, collate_fn=dataset.collate_fn, speaker_ids=speaker_mapping if use_speaker_ids else None
+        )
+
+        num_workers = config.num_val_loader_workers if is_val else config.num_loader_workers
+        worker_kwargs = {}
+        if num_workers > 0:
+            # keep the workers alive between epochs and start them from a clean process instead of
+            # forking the training process after CUDA is initialized.
+            worker_kwargs = {"persistent_workers": True, "prefetch_factor": config.prefetch_factor}
+            if sys.platform.startswith("linux"):
+                worker_kwargs["multiprocessing_context"] = "forkserver"
+
+        sampler = DistributedSampler(dataset, shuffle=True) if num_gpus > 1 else None
         loader = DataLoader(
             dataset,
             batch_size=config.eval_batch_size if is_val else config.batch_size,
             shuffle=False,
-            collate_fn=dataset.collate_fn,
+            collate_fn=collate_fn,
             drop_last=False,
             sampler=sampler,
-            num_workers=config.num_val_loader_workers if is_val else config.num_loader_workers,
-            pin_memory=False,
+            num_workers=num_workers,
+            pin_memory=config.pin_memory and use_cuda,
+            **worker_kwargs,
         )
     return loader
 
@@ -83,13 +108,11 @@ def format_data(data):
     # setup input data
     text_input = data[0]
     text_lengths = data[1]
-    speaker_names = data[2]
-    mel_input = data[4].permute(0, 2, 1)  # B x D x T
+    mel_input = data[4]  # B x D x T
+    assert mel_input.stride(-1) == 1, " [!] mel spectrograms are expected to be contiguous in time."
     mel_lengths = data[5]
     item_idx = data[7]
     attn_mask = data[9]
-    avg_text_length = torch.mean(text_lengths.float())
-    avg_spec_length = torch.mean(mel_lengths.float())
 
     if config.use_speaker_embedding:
         if config.use_external_speaker_embedding_file:
@@ -97,8 +120,7 @@ def format_data(data):
             speaker_c = data[8]
         else:
             # return speaker_id to be used by an embedding layer
-            speaker_c = [speaker_mapping[speaker_name] for speaker_name in speaker_names]
-            speaker_c = torch.LongTensor(speaker_c)
+            speaker_c = data[10]
     else:
         speaker_c = None
 
@@ -118,23 +140,16 @@ def format_data(data):
         mel_input,
         mel_lengths,
         speaker_c,
-        avg_text_length,
-        avg_spec_length,
         attn_mask,
         item_idx,
     )
 
 
-def data_depended_init(data_loader, model):
+def data_depended_init(data_loader, model, inner_model):
     """Data depended initialization for activation normalization."""
-    if hasattr(model, "module"):
-        for f in model.module.decoder.flows:
-            if getattr(f, "set_ddi", False):
-                f.set_ddi(True)
-    else:
-        for f in model.decoder.flows:
-            if getattr(f, "set_ddi", False):
-                f.set_ddi(True)
+    for f in inner_model.decoder.flows:
+        if getattr(f, "set_ddi", False):
+            f.set_ddi(True)
 
     model.train()
     print(" > Data depended initialization ... ")
@@ -143,7 +158,7 @@ def data_depended_init(data_loader, model):
         for _, data in enumerate(data_loader):
 
             # format data
-            text_input, text_lengths, mel_input, mel_lengths, spekaer_embed, _, _, attn_mask, _ = format_data(data)
+            text_input, text_lengths, mel_input, mel_lengths, spekaer_embed, attn_mask, _ = format_data(data)
 
             # forward pass model
             _ = model.forward(text_input, text_lengths, mel_input, mel_lengths, attn_mask, g=spekaer_embed)
@@ -151,30 +166,62 @@ def data_depended_init(data_loader, model):
                 break
             num_iter += 1
 
-    if hasattr(model, "module"):
-        for f in model.module.decoder.flows:
-            if getattr(f, "set_ddi", False):
-                f.set_ddi(False)
-    else:
-        for f in model.decoder.flows:
-            if getattr(f, "set_ddi", False):
-                f.set_ddi(False)
+    for f in inner_model.decoder.flows:
+        if getattr(f, "set_ddi", False):
+            f.set_ddi(False)
     return model
 
 
-def train(data_loader, model, criterion, optimizer, scheduler, ap, global_step, epoch):
+def log_train_diagnostics(spec_pred, gt_spec, align_img, global_step, ap):
+    """Plot the training figures and synthesize a sample audio by Griffin-Lim on Tensorboard.
+    It is run by `_diag_pool` with CPU tensors detached from the graph.
+
+    Shapes:
+        spec_pred : D x T
+        gt_spec : D x T
+        align_img : T_de x T_en
+    """
+    const_spec = spec_pred.permute(1, 0).numpy()
+    gt_spec = gt_spec.permute(1, 0).numpy()
+    align_img = align_img.numpy()
+
+    figures = {
+        "prediction": plot_spectrogram(const_spec, ap),
+        "ground_truth": plot_spectrogram(gt_spec, ap),
+        "alignment": plot_alignment(align_img),
+    }
+
+    tb_logger.tb_train_figures(global_step, figures)
+
+    # Sample audio
+    train_audio = ap.inv_melspectrogram(const_spec.T)
+    tb_logger.tb_train_audios(global_step, {"TrainAudio": train_audio}, config.audio["sample_rate"])
+
+
+def train(data_loader, model, inner_model, criterion, optimizer, scheduler, ap, global_step, epoch):
 
     model.train()
     epoch_time = 0
     keep_avg = KeepAverage()
-    if use_cuda:
-        batch_n_iter = int(len(data_loader.dataset) / (config.batch_size * num_gpus))
-    else:
-        batch_n_iter = int(len(data_loader.dataset) / config.batch_size)
+    batch_n_iter = len(data_loader)
     end_time = time.time()
     c_logger.print_train_start()
-    scaler = torch.cuda.amp.GradScaler() if config.mixed_precision else None
-    for num_iter, data in enumerate(data_loader):
+    # bf16 has the exponent range of fp32, so it needs no loss scaling
+    amp_dtype = torch.bfloat16 if config.amp_dtype == "bf16" else torch.float16
+    use_grad_scaler = config.mixed_precision and amp_dtype == torch.float16
+    scaler = torch.cuda.amp.GradScaler() if use_grad_scaler else None
+    grad_accum_steps = config.grad_accum_steps
+    diag_future = None
+    ckpt_future = None
+    # reused by the all-reduce of the loss values
+    reduce_buffer = torch.empty(3, device="cuda") if num_gpus > 1 else None
+    # reused at every step, the loss keys are cached at the first step
+    tensor_keys, avg_keys = None, None
+    loss_values, update_train_values = {}, {}
+    optimizer.zero_grad(set_to_none=True)
+    # format and dispatch the next batch while the current one is being processed
+    batches = CUDAPrefetcher(data_loader, format_data) if use_cuda else map(format_data, data_loader)
+    for num_iter, batch in enumerate(batches):
         start_time = time.time()
 
         # format data
@@ -184,41 +231,53 @@ def train(data_loader, model, criterion, optimizer, scheduler, ap, global_step,
             mel_input,
             mel_lengths,
             speaker_c,
-            avg_text_length,
-            avg_spec_length,
             attn_mask,
             _,
-        ) = format_data(data)
+        ) = batch
 
         loader_time = time.time() - end_time
 
         global_step += 1
-        optimizer.zero_grad()
 
-        # forward pass model
-        with torch.cuda.amp.autocast(enabled=config.mixed_precision):
-            z, logdet, y_mean, y_log_scale, alignments, o_dur_log, o_total_dur = model.forward(
-                text_input, text_lengths, mel_input, mel_lengths, attn_mask, g=speaker_c
-            )
+        # update the weights only at the last micro-batch of each accumulation cycle. The last cycle of the epoch
+        # may be shorter so that its micro-batches are not dropped.
+        cycle_start = num_iter - num_iter % grad_accum_steps
+        num_micro_steps = min(grad_accum_steps, batch_n_iter - cycle_start)
+        is_update_step = num_iter + 1 == cycle_start + num_micro_steps
+        # skip the gradient all-reduce of DDP for the intermediate micro-batches
+        sync_context = model.no_sync() if num_gpus > 1 and not is_update_step else contextlib.nullcontext()
 
-            # compute loss
-            loss_dict = criterion(z, y_mean, y_log_scale, logdet, mel_lengths, o_dur_log, o_total_dur, text_lengths)
+        with sync_context:
+            # forward pass model
+            with torch.cuda.amp.autocast(enabled=config.mixed_precision, dtype=amp_dtype):
+                z, logdet, y_mean, y_log_scale, alignments, o_dur_log, o_total_dur = model.forward(
+                    text_input, text_lengths, mel_input, mel_lengths, attn_mask, g=speaker_c
+                )
 
-        # backward pass with loss scaling
-        if config.mixed_precision:
-            scaler.scale(loss_dict["loss"]).backward()
-            scaler.unscale_(optimizer)
-            grad_norm = torch.nn.utils.clip_grad_norm_(model.parameters(), config.grad_clip)
-            scaler.step(optimizer)
-            scaler.update()
-        else:
-            loss_dict["loss"].backward()
-            grad_norm = torch.nn.utils.clip_grad_norm_(model.parameters(), config.grad_clip)
-            optimizer.step()
+                # compute loss
+                loss_dict = criterion(z, y_mean, y_log_scale, logdet, mel_lengths, o_dur_log, o_total_dur, text_lengths)
 
-        # setup lr
-        if config.noam_schedule:
-            scheduler.step()
+            # backward pass with loss scaling
+            loss = loss_dict["loss"] / num_micro_steps
+            if use_grad_scaler:
+                scaler.scale(loss).backward()
+            else:
+                loss.backward()
+
+        if is_update_step:
+            if use_grad_scaler:
+                scaler.unscale_(optimizer)
+                grad_norm = torch.nn.utils.clip_grad_norm_(model.parameters(), config.grad_clip)
+                scaler.step(optimizer)
+                scaler.update()
+            else:
+                grad_norm = torch.nn.utils.clip_grad_norm_(model.parameters(), config.grad_clip)
+                optimizer.step()
+            optimizer.zero_grad(set_to_none=True)
+
+            # setup lr
+            if config.noam_schedule:
+                scheduler.step()
 
         # current_lr
         current_lr = optimizer.param_groups[0]["lr"]
@@ -232,23 +291,24 @@ def train(data_loader, model, criterion, optimizer, scheduler, ap, global_step,
 
         # aggregate losses from processes
         if num_gpus > 1:
-            loss_dict["log_mle"] = reduce_tensor(loss_dict["log_mle"].data, num_gpus)
-            loss_dict["loss_dur"] = reduce_tensor(loss_dict["loss_dur"].data, num_gpus)
-            loss_dict["loss"] = reduce_tensor(loss_dict["loss"].data, num_gpus)
+            loss_dict["log_mle"], loss_dict["loss_dur"], loss_dict["loss"] = reduce_tensors(
+                [loss_dict[key].detach().float() for key in ("log_mle", "loss_dur", "loss")],
+                num_gpus,
+                out=reduce_buffer,
+            )
 
-        # detach loss values
-        loss_dict_new = dict()
-        for key, value in loss_dict.items():
-            if isinstance(value, (int, float)):
-                loss_dict_new[key] = value
-            else:
-                loss_dict_new[key] = value.item()
-        loss_dict = loss_dict_new
+        # detach loss values by a single device to host copy
+        if tensor_keys is None:
+            tensor_keys = [key for key, value in loss_dict.items() if torch.is_tensor(value)]
+            avg_keys = {key: "avg_" + key for key in loss_dict}
+        tensor_values = torch.stack([loss_dict[key].detach().float() for key in tensor_keys]).cpu().tolist()
+        loss_values.update(loss_dict)
+        loss_values.update(zip(tensor_keys, tensor_values))
+        loss_dict = loss_values
 
         # update avg stats
-        update_train_values = dict()
         for key, value in loss_dict.items():
-            update_train_values["avg_" + key] = value
+            update_train_values[avg_keys[key]] = value
         update_train_values["avg_loader_time"] = loader_time
         update_train_values["avg_step_time"] = step_time
         keep_avg.update_values(update_train_values)
@@ -256,8 +316,8 @@ def train(data_loader, model, criterion, optimizer, scheduler, ap, global_step,
         # print training progress
         if global_step % config.print_step == 0:
             log_dict = {
-                "avg_spec_length": [avg_spec_length, 1],  # value, precision
-                "avg_text_length": [avg_text_length, 1],
+                "avg_spec_length": [mel_lengths.float().mean().item(), 1],  # value, precision
+                "avg_text_length": [text_lengths.float().mean().item(), 1],
                 "step_time": [step_time, 4],
                 "loader_time": [loader_time, 2],
                 "current_lr": current_lr,
@@ -268,16 +328,21 @@ def train(data_loader, model, criterion, optimizer, scheduler, ap, global_step,
             # Plot Training Iter Stats
             # reduce TB load
             if global_step % config.tb_plot_step == 0:
-                iter_stats = {"lr": current_lr, "grad_norm": grad_norm, "step_time": step_time}
+                iter_stats = {"lr": current_lr, "step_time": step_time}
+                if is_update_step:
+                    iter_stats["grad_norm"] = grad_norm
                 iter_stats.update(loss_dict)
                 tb_logger.tb_train_iter_stats(global_step, iter_stats)
 
             if global_step % config.save_step == 0:
                 if config.checkpoint:
-                    # save model
-                    save_checkpoint(
-                        model,
-                        optimizer,
+                    # save model in the background from a CPU copy of the states. Keep one write in flight.
+                    if ckpt_future is not None:
+                        ckpt_future.result()
+                    ckpt_future = _ckpt_pool.submit(
+                        save_checkpoint,
+                        copy_state_dict_to_cpu(inner_model.state_dict()),
+                        copy_state_dict_to_cpu(optimizer.state_dict()),
                         global_step,
                         epoch,
                         1,
@@ -286,37 +351,33 @@ def train(data_loader, model, criterion, optimizer, scheduler, ap, global_step,
                         model_loss=loss_dict["loss"],
                     )
 
-                # wait all kernels to be completed
-                torch.cuda.synchronize()
-
                 # Diagnostic visualizations
                 # direct pass on model for spec predictions
                 target_speaker = None if speaker_c is None else speaker_c[:1]
 
-                if hasattr(model, "module"):
-                    spec_pred, *_ = model.module.inference(text_input[:1], text_lengths[:1], g=target_speaker)
-                else:
-                    spec_pred, *_ = model.inference(text_input[:1], text_lengths[:1], g=target_speaker)
-
-                spec_pred = spec_pred.permute(0, 2, 1)
-                gt_spec = mel_input.permute(0, 2, 1)
-                const_spec = spec_pred[0].data.cpu().numpy()
-                gt_spec = gt_spec[0].data.cpu().numpy()
-                align_img = alignments[0].data.cpu().numpy()
-
-                figures = {
-                    "prediction": plot_spectrogram(const_spec, ap),
-                    "ground_truth": plot_spectrogram(gt_spec, ap),
-                    "alignment": plot_alignment(align_img),
-                }
-
-                tb_logger.tb_train_figures(global_step, figures)
-
-                # Sample audio
-                train_audio = ap.inv_melspectrogram(const_spec.T)
-                tb_logger.tb_train_audios(global_step, {"TrainAudio": train_audio}, config.audio["sample_rate"])
+                spec_pred, *_ = inner_model.inference(text_input[:1], text_lengths[:1], g=target_speaker)
+
+                # plotting and Griffin-Lim run in the background. The host copies already wait for the copied values
+                # and `copy=True` makes a single fresh copy whether the tensors are on the GPU or the CPU.
+                if diag_future is not None:
+                    diag_future.result()
+                diag_future = _diag_pool.submit(
+                    log_train_diagnostics,
+                    spec_pred[0].detach().to("cpu", copy=True),
+                    mel_input[0].detach().to("cpu", copy=True),
+                    alignments[0].detach().float().to("cpu", copy=True),
+                    global_step,
+                    ap,
+                )
         end_time = time.time()
 
+    # wait for the last diagnostics before plotting anything else
+    if diag_future is not None:
+        diag_future.result()
+    # wait for the last checkpoint to be written
+    if ckpt_future is not None:
+        ckpt_future.result()
+
     # print epoch stats
     c_logger.print_train_epoch_end(global_step, epoch, epoch_time, keep_avg)
 
@@ -331,17 +392,21 @@ def train(data_loader, model, criterion, optimizer, scheduler, ap, global_step,
 
 
 @torch.no_grad()
-def evaluate(data_loader, model, criterion, ap, global_step, epoch):
+def evaluate(data_loader, model, inner_model, criterion, ap, global_step, epoch):
     model.eval()
     epoch_time = 0
     keep_avg = KeepAverage()
     c_logger.print_eval_start()
     if data_loader is not None:
-        for num_iter, data in enumerate(data_loader):
+        reduce_buffer = torch.empty(3, device="cuda") if num_gpus > 1 else None
+        tensor_keys, avg_keys = None, None
+        loss_values, update_train_values = {}, {}
+        batches = CUDAPrefetcher(data_loader, format_data) if use_cuda else map(format_data, data_loader)
+        for num_iter, batch in enumerate(batches):
             start_time = time.time()
 
             # format data
-            text_input, text_lengths, mel_input, mel_lengths, speaker_c, _, _, attn_mask, _ = format_data(data)
+            text_input, text_lengths, mel_input, mel_lengths, speaker_c, attn_mask, _ = batch
 
             # forward pass model
             z, logdet, y_mean, y_log_scale, alignments, o_dur_log, o_total_dur = model.forward(
@@ -361,23 +426,24 @@ def evaluate(data_loader, model, criterion, ap, global_step, epoch):
 
             # aggregate losses from processes
             if num_gpus > 1:
-                loss_dict["log_mle"] = reduce_tensor(loss_dict["log_mle"].data, num_gpus)
-                loss_dict["loss_dur"] = reduce_tensor(loss_dict["loss_dur"].data, num_gpus)
-                loss_dict["loss"] = reduce_tensor(loss_dict["loss"].data, num_gpus)
+                loss_dict["log_mle"], loss_dict["loss_dur"], loss_dict["loss"] = reduce_tensors(
+                    [loss_dict[key].detach().float() for key in ("log_mle", "loss_dur", "loss")],
+                    num_gpus,
+                    out=reduce_buffer,
+                )
 
-            # detach loss values
-            loss_dict_new = dict()
-            for key, value in loss_dict.items():
-                if isinstance(value, (int, float)):
-                    loss_dict_new[key] = value
-                else:
-                    loss_dict_new[key] = value.item()
-            loss_dict = loss_dict_new
+            # detach loss values by a single device to host copy
+            if tensor_keys is None:
+                tensor_keys = [key for key, value in loss_dict.items() if torch.is_tensor(value)]
+                avg_keys = {key: "avg_" + key for key in loss_dict}
+            tensor_values = torch.stack([loss_dict[key].detach().float() for key in tensor_keys]).cpu().tolist()
+            loss_values.update(loss_dict)
+            loss_values.update(zip(tensor_keys, tensor_values))
+            loss_dict = loss_values
 
             # update avg stats
-            update_train_values = dict()
             for key, value in loss_dict.items():
-                update_train_values["avg_" + key] = value
+                update_train_values[avg_keys[key]] = value
             keep_avg.update_values(update_train_values)
 
             if config.print_eval:
@@ -387,10 +453,7 @@ def evaluate(data_loader, model, criterion, ap, global_step, epoch):
             # Diagnostic visualizations
             # direct pass on model for spec predictions
             target_speaker = None if speaker_c is None else speaker_c[:1]
-            if hasattr(model, "module"):
-                spec_pred, *_ = model.module.inference(text_input[:1], text_lengths[:1], g=target_speaker)
-            else:
-                spec_pred, *_ = model.inference(text_input[:1], text_lengths[:1], g=target_speaker)
+            spec_pred, *_ = inner_model.inference(text_input[:1], text_lengths[:1], g=target_speaker)
             spec_pred = spec_pred.permute(0, 2, 1)
             gt_spec = mel_input.permute(0, 2, 1)
 
@@ -443,10 +506,11 @@ def evaluate(data_loader, model, criterion, ap, global_step, epoch):
             speaker_embedding = None
 
         style_wav = config.style_wav_for_test
+        test_outputs = []
         for idx, test_sentence in enumerate(test_sentences):
             try:
-                wav, alignment, _, postnet_output, _, _ = synthesis(
-                    model,
+                _, alignment, _, postnet_output, _, _ = synthesis(
+                    inner_model,
                     test_sentence,
                     config,
                     use_cuda,
@@ -456,20 +520,29 @@ def evaluate(data_loader, model, criterion, ap, global_step, epoch):
                     style_wav=style_wav,
                     truncated=False,
                     enable_eos_bos_chars=config.enable_eos_bos_chars,  # pylint: disable=unused-argument
-                    use_griffin_lim=True,
+                    use_griffin_lim=False,
                     do_trim_silence=False,
                 )
-
-                file_path = os.path.join(AUDIO_PATH, str(global_step))
-                os.makedirs(file_path, exist_ok=True)
-                file_path = os.path.join(file_path, "TestSentence_{}.wav".format(idx))
-                ap.save_wav(wav, file_path)
-                test_audios["{}-audio".format(idx)] = wav
-                test_figures["{}-prediction".format(idx)] = plot_spectrogram(postnet_output, ap)
-                test_figures["{}-alignment".format(idx)] = plot_alignment(alignment)
+                test_outputs.append((idx, postnet_output, alignment))
             except:  # pylint: disable=bare-except
                 print(" !! Error creating Test Sentence -", idx)
                 traceback.print_exc()
+
+        # Griffin-Lim is CPU bound, run it for all the sentences in parallel
+        if test_outputs:
+            file_path = os.path.join(AUDIO_PATH, str(global_step))
+            os.makedirs(file_path, exist_ok=True)
+            futures = [_gl_pool.submit(griffin_lim_worker, postnet_output) for _, postnet_output, _ in test_outputs]
+            for (idx, postnet_output, alignment), future in zip(test_outputs, futures):
+                try:
+                    wav = future.result()
+                    ap.save_wav(wav, os.path.join(file_path, "TestSentence_{}.wav".format(idx)))
+                    test_audios["{}-audio".format(idx)] = wav
+                    test_figures["{}-prediction".format(idx)] = plot_spectrogram(postnet_output, ap)
+                    test_figures["{}-alignment".format(idx)] = plot_alignment(alignment)
+                except:  # pylint: disable=bare-except
+                    print(" !! Error creating Test Sentence -", idx)
+                    traceback.print_exc()
         tb_logger.tb_test_audios(global_step, test_audios, config.audio["sample_rate"])
         tb_logger.tb_test_figures(global_step, test_figures)
     return keep_avg.avg_values
@@ -528,17 +601,23 @@ def main(args):  # pylint: disable=redefined-outer-name
         model.cuda()
         criterion.cuda()
 
+    if config.allow_tf32:
+        # run the fp32 matmuls on the tensor cores of Ampere and newer GPUs, cuDNN already does it for convolutions
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+
+    if config.mixed_precision and config.amp_dtype == "bf16" and not (use_cuda and torch.cuda.is_bf16_supported()):
+        print(" > bf16 is not supported on this device, falling back to fp16 mixed precision.")
+        config.amp_dtype = "fp16"
+
     # DISTRUBUTED
     if num_gpus > 1:
         model = DDP_th(model, device_ids=[args.rank])
+    inner_model = model.module if hasattr(model, "module") else model
 
-    if config.noam_schedule:
-        scheduler = NoamLR(optimizer, warmup_steps=config.warmup_steps, last_epoch=args.restore_step - 1)
-    else:
-        scheduler = None
-
-    num_params = count_parameters(model)
-    print("\n > Model has {} parameters".format(num_params), flush=True)
+    if args.rank == 0:
+        num_params = count_parameters(model)
+        print("\n > Model has {} parameters".format(num_params), flush=True)
 
     if args.restore_step == 0 or not args.best_path:
         best_loss = float("inf")
@@ -554,14 +633,38 @@ def main(args):  # pylint: disable=redefined-outer-name
     train_loader = setup_loader(ap, 1, is_val=False, verbose=True)
     eval_loader = setup_loader(ap, 1, is_val=True, verbose=True)
 
+    if config.noam_schedule:
+        # `global_step` counts micro-batches but the scheduler steps once per optimizer update. The last accumulation
+        # cycle of each epoch may be shorter, so an epoch has `ceil(len(train_loader) / grad_accum_steps)` updates.
+        num_epochs_done, num_iters_done = divmod(args.restore_step, len(train_loader))
+        num_updates_done = (
+            num_epochs_done * math.ceil(len(train_loader) / config.grad_accum_steps)
+            + num_iters_done // config.grad_accum_steps
+        )
+        scheduler = NoamLR(optimizer, warmup_steps=config.warmup_steps, last_epoch=num_updates_done - 1)
+    else:
+        scheduler = None
+
     global_step = args.restore_step
-    model = data_depended_init(train_loader, model)
+    model = data_depended_init(train_loader, model, inner_model)
+
+    # compile after the data depended initialization so that it does not trace the DDI mode.
+    if config.torch_compile:
+        import torch._dynamo  # pylint: disable=import-outside-toplevel
+
+        # every length bucket is a new input shape
+        torch._dynamo.config.cache_size_limit = 256  # pylint: disable=protected-access
+        # only `forward` is compiled to keep the model object and its state_dict keys intact.
+        inner_model.forward = torch.compile(inner_model.forward, mode="reduce-overhead", dynamic=True)
     for epoch in range(0, config.epochs):
         c_logger.print_epoch_start(epoch, config.epochs)
+        # reshuffle the data shards differently at every epoch
+        if isinstance(train_loader.sampler, DistributedSampler):
+            train_loader.sampler.set_epoch(epoch)
         train_avg_loss_dict, global_step = train(
-            train_loader, model, criterion, optimizer, scheduler, ap, global_step, epoch
+            train_loader, model, inner_model, criterion, optimizer, scheduler, ap, global_step, epoch
         )
-        eval_avg_loss_dict = evaluate(eval_loader, model, criterion, ap, global_step, epoch)
+        eval_avg_loss_dict = evaluate(eval_loader, model, inner_model, criterion, ap, global_step, epoch)
         c_logger.print_epoch_end(epoch, eval_avg_loss_dict)
         target_loss = train_avg_loss_dict["avg_loss"]
         if config.run_eval:
@@ -582,8 +685,25 @@ def main(args):  # pylint: disable=redefined-outer-name
 
 
 if __name__ == "__main__":
+    # set up under the main guard since the worker processes started by forkserver re-import this script
+    use_cuda, num_gpus = setup_torch_training_env(True, False)
+
+    # runs the CPU bound training diagnostics out of the training loop
+    _diag_pool = ThreadPoolExecutor(max_workers=1)
+    # writes the training checkpoints out of the training loop
+    _ckpt_pool = ThreadPoolExecutor(max_workers=1)
+
     args, config, OUT_PATH, AUDIO_PATH, c_logger, tb_logger = init_training(sys.argv)
 
+    # runs Griffin-Lim for the test sentences in parallel, the workers are started on the first evaluation.
+    # On Linux they are not forked from the training process after CUDA is initialized.
+    _gl_pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("forkserver") if sys.platform.startswith("linux") else None,
+        initializer=init_griffin_lim_worker,
+        initargs=(config.audio.to_dict(),),
+    )
+
     try:
         main(args)
     except KeyboardInterrupt:
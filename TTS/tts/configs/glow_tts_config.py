@@ -1,4 +1,6 @@
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+
+from coqpit import check_argument
 
 from TTS.tts.configs.shared_configs import BaseTTSConfig
 
@@ -34,6 +36,27 @@ class GlowTTSConfig(BaseTTSConfig):
             Number of steps used for computing normalization parameters at the beginning of the training. GlowTTS uses
             Activation Normalization that pre-computes normalization stats at the beginning and use the same values
             for the rest. Defaults to 10.
+        pin_memory (bool):
+            enable / disable pinned (page-locked) host memory in the data loaders. It lets the host-to-device copies
+            run asynchronously. Disable it on Windows or low-RAM machines. Defaults to True.
+        prefetch_factor (int):
+            Number of batches loaded in advance by each data loader worker. Keep it small when `pin_memory` is enabled
+            since every prefetched batch holds pinned memory. It is in use if ```num_loader_workers > 0```.
+            Defaults to 4.
+        grad_accum_steps (int):
+            Number of micro-batches whose gradients are accumulated before each optimizer step. In multi-gpu training,
+            gradients are only synchronized at the last micro-batch. Defaults to 1.
+        amp_dtype (str):
+            Data type used by mixed precision training, either `fp16` or `bf16`. `bf16` needs an Ampere or newer GPU
+            and skips loss scaling since it has the exponent range of fp32. It is in use if
+            ```mixed_precision == True```. Defaults to `fp16`.
+        allow_tf32 (bool):
+            enable TF32 tensor core math for the fp32 matmuls on Ampere or newer GPUs. It trades a little precision
+            for speed. The cuDNN convolutions use TF32 by default and are not affected when it is False.
+            Defaults to False.
+        torch_compile (bool):
+            enable / disable compiling the model forward pass by `torch.compile`. It needs PyTorch 2.0 or newer.
+            Inference is not compiled. Defaults to False.
         style_wav_for_test (str):
             Path to the wav file used for changing the style of the speech. Defaults to None.
         inference_noise_scale (float):
@@ -79,6 +102,12 @@ class GlowTTSConfig(BaseTTSConfig):
 
     # training params
     data_dep_init_steps: int = 10
+    pin_memory: bool = True
+    prefetch_factor: int = 4
+    grad_accum_steps: int = 1
+    amp_dtype: str = "fp16"
+    allow_tf32: bool = False
+    torch_compile: bool = False
 
     # inference params
     style_wav_for_test: str = None
@@ -100,3 +129,9 @@ class GlowTTSConfig(BaseTTSConfig):
     min_seq_len: int = 3
     max_seq_len: int = 500
     r: int = 1  # DO NOT CHANGE - TODO: make this immutable once coqpit implements it.
+
+    def check_values(self):
+        """Check config fields"""
+        c = asdict(self)
+        super().check_values()
+        check_argument("grad_accum_steps", c, restricted=True, min_val=1)
@@ -1,4 +1,5 @@
 import numpy as np
+import torch
 
 
 def _pad_data(x, length):
@@ -45,6 +46,17 @@ def pad_per_step(inputs, pad_len):
 
 
 # pylint: disable=attribute-defined-outside-init
+def collate_glow_tts(batch, collate_fn, speaker_ids=None):
+    """Collate a batch by `collate_fn` and adapt it to GlowTTS on the loader workers.
+    The mel spectrograms are made contiguous in `B x D x T` layout and, if `speaker_ids` is given, the speaker ids
+    of the samples are appended as a `torch.LongTensor`."""
+    data = list(collate_fn(batch))
+    data[4] = data[4].permute(0, 2, 1).contiguous()  # B x T x D --> B x D x T
+    if speaker_ids is not None:
+        data.append(torch.LongTensor([speaker_ids[speaker_name] for speaker_name in data[2]]))
+    return tuple(data)
+
+
 class StandardScaler:
     def set_stats(self, mean, scale):
         self.mean_ = mean
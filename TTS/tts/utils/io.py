@@ -42,8 +42,8 @@ def save_model(model, optimizer, current_step, epoch, r, output_path, characters
     """Save ```TTS.tts.models``` states with extra fields.
 
     Args:
-        model (TTS.tts.models.Model): models object to be saved.
-        optimizer (torch.optim.optimizers.Optimizer): model optimizer used for training.
+        model (TTS.tts.models.Model | dict): models object or its state_dict to be saved.
+        optimizer (torch.optim.optimizers.Optimizer | dict): model optimizer used for training or its state_dict.
         current_step (int): current number of training steps.
         epoch (int): current number of training epochs.
         r (int): model reduction rate for Tacotron models.
@@ -51,13 +51,19 @@ def save_model(model, optimizer, current_step, epoch, r, output_path, characters
         characters (list): list of characters used in the model.
         amp_state_dict (state_dict, optional): Apex.amp state dict if Apex is enabled. Defaults to None.
     """
-    if hasattr(model, "module"):
+    if isinstance(model, dict):
+        model_state = model
+    elif hasattr(model, "module"):
         model_state = model.module.state_dict()
     else:
         model_state = model.state_dict()
+    if isinstance(optimizer, dict):
+        optimizer_state = optimizer
+    else:
+        optimizer_state = optimizer.state_dict() if optimizer is not None else None
     state = {
         "model": model_state,
-        "optimizer": optimizer.state_dict() if optimizer is not None else None,
+        "optimizer": optimizer_state,
         "step": current_step,
         "epoch": epoch,
         "date": datetime.date.today().strftime("%B %d, %Y"),
@@ -70,12 +76,28 @@ def save_model(model, optimizer, current_step, epoch, r, output_path, characters
     torch.save(state, output_path)
 
 
+def copy_state_dict_to_cpu(state_dict):
+    """Copy a (nested) state_dict with its tensors moved to CPU. The copy is not affected by the later updates of
+    the model or the optimizer, so it can be saved in the background.
+
+    Args:
+        state_dict (dict): model or optimizer state_dict.
+    """
+    if torch.is_tensor(state_dict):
+        return state_dict.detach().to("cpu", copy=True)
+    if isinstance(state_dict, dict):
+        return {key: copy_state_dict_to_cpu(value) for key, value in state_dict.items()}
+    if isinstance(state_dict, (list, tuple)):
+        return type(state_dict)(copy_state_dict_to_cpu(value) for value in state_dict)
+    return state_dict
+
+
 def save_checkpoint(model, optimizer, current_step, epoch, r, output_folder, characters, **kwargs):
     """Save model checkpoint, intended for saving checkpoints at training.
 
     Args:
-        model (TTS.tts.models.Model): models object to be saved.
-        optimizer (torch.optim.optimizers.Optimizer): model optimizer used for training.
+        model (TTS.tts.models.Model | dict): models object or its state_dict to be saved.
+        optimizer (torch.optim.optimizers.Optimizer | dict): model optimizer used for training or its state_dict.
         current_step (int): current number of training steps.
         epoch (int): current number of training epochs.
         r (int): model reduction rate for Tacotron models.
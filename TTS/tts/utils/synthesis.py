@@ -4,6 +4,8 @@ import numpy as np
 import pkg_resources
 import torch
 
+from TTS.utils.audio import AudioProcessor
+
 from .text import phoneme_to_sequence, text_to_sequence
 
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
@@ -185,6 +187,31 @@ def inv_spectrogram(postnet_output, ap, CONFIG):
     return wav
 
 
+# `AudioProcessor` of a Griffin-Lim worker process, built once by `init_griffin_lim_worker`.
+_worker_ap = None
+
+
+def init_griffin_lim_worker(audio_config):
+    """Initialize a Griffin-Lim worker process of a `ProcessPoolExecutor`. The `AudioProcessor` is rebuilt from its
+    config since the instance is not shipped between processes.
+
+    Args:
+        audio_config (Dict): audio parameters to init `AudioProcessor`.
+    """
+    global _worker_ap  # pylint: disable=global-statement
+    _worker_ap = AudioProcessor(verbose=False, **audio_config)
+
+
+def griffin_lim_worker(mel_spec):
+    """Convert a predicted melspectrogram to waveform by Griffin-Lim in a worker process
+    initialized by `init_griffin_lim_worker`.
+
+    Shapes:
+        mel_spec : T x D
+    """
+    return _worker_ap.inv_melspectrogram(mel_spec.T)
+
+
 def id_to_torch(speaker_id, cuda=False):
     if speaker_id is not None:
         speaker_id = np.asarray(speaker_id)
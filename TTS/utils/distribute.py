@@ -57,6 +57,23 @@ def reduce_tensor(tensor, num_gpus):
     return rt
 
 
+def reduce_tensors(tensors, num_gpus, out=None):
+    """Average a list of same shaped tensors over the processes by a single all-reduce.
+
+    Args:
+        tensors (List[torch.Tensor]): tensors to be averaged.
+        num_gpus (int): number of processes.
+        out (torch.Tensor, optional): preallocated buffer to stack the tensors in. Defaults to None.
+
+    Returns:
+        Tuple[torch.Tensor]: averaged tensors as views of the reduced buffer.
+    """
+    rt = torch.stack(tensors, out=out)
+    dist.all_reduce(rt, op=dist.ReduceOp.SUM)
+    rt /= num_gpus
+    return rt.unbind(0)
+
+
 def init_distributed(rank, num_gpus, group_name, dist_backend, dist_url):
     assert torch.cuda.is_available(), "Distributed mode requires CUDA."
 
@@ -107,3 +107,44 @@ def gradual_training_scheduler(global_step, config):
         if global_step * num_gpus >= values[0]:
             new_values = values
     return new_values[1], new_values[2]
+
+
+class CUDAPrefetcher:
+    """Wrap a data loader and run `format_fn` for the next batch on a side CUDA stream,
+    so that its host-to-device copies overlap with the computation on the current batch.
+
+    Args:
+        data_loader (torch.utils.data.DataLoader): loader yielding the raw batches.
+        format_fn (Callable): function formatting a raw batch and moving its tensors to the GPU.
+    """
+
+    def __init__(self, data_loader, format_fn):
+        self.loader = iter(data_loader)
+        self.format_fn = format_fn
+        self.stream = torch.cuda.Stream()
+        self.next_batch = None
+        self.preload()
+
+    def preload(self):
+        try:
+            data = next(self.loader)
+        except StopIteration:
+            self.next_batch = None
+            return
+        with torch.cuda.stream(self.stream):
+            self.next_batch = self.format_fn(data)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        torch.cuda.current_stream().wait_stream(self.stream)
+        batch = self.next_batch
+        if batch is None:
+            raise StopIteration
+        # tensors allocated on the side stream must not be reused before the main stream is done with them
+        for item in batch:
+            if torch.is_tensor(item) and item.is_cuda:
+                item.record_stream(torch.cuda.current_stream())
+        self.preload()
+        return batch
@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+
+import torch
+import torch.distributed as dist
+
+from TTS.utils.distribute import reduce_tensors
+
+
+@unittest.skipIf(not dist.is_available(), "torch.distributed is not available.")
+class TestReduceTensors(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        init_method = "file://" + os.path.join(cls.tmp_dir, "dist_init")
+        dist.init_process_group("gloo", init_method=init_method, world_size=1, rank=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        dist.destroy_process_group()
+
+    def test_average(self):
+        tensors = [torch.tensor(2.0), torch.tensor(4.0), torch.tensor(6.0)]
+        reduced = reduce_tensors(tensors, 1)
+        assert len(reduced) == 3
+        assert [value.item() for value in reduced] == [2.0, 4.0, 6.0]
+        # the sum over the processes is divided by `num_gpus`
+        reduced = reduce_tensors(tensors, 2)
+        assert [value.item() for value in reduced] == [1.0, 2.0, 3.0]
+        # inputs are not modified
+        assert [value.item() for value in tensors] == [2.0, 4.0, 6.0]
+
+    def test_reuse_out(self):
+        out = torch.empty(3)
+        reduced = reduce_tensors([torch.tensor(1.0), torch.tensor(2.0), torch.tensor(3.0)], 1, out=out)
+        assert [value.item() for value in reduced] == [1.0, 2.0, 3.0]
+        assert reduced[0].data_ptr() == out.data_ptr()
+
+        reduced = reduce_tensors([torch.tensor(4.0), torch.tensor(5.0), torch.tensor(6.0)], 1, out=out)
+        assert [value.item() for value in reduced] == [4.0, 5.0, 6.0]
+        assert reduced[0].data_ptr() == out.data_ptr()
+        assert out.tolist() == [4.0, 5.0, 6.0]
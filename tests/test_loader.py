@@ -1,3 +1,4 @@
+import functools
 import os
 import shutil
 import unittest
@@ -10,6 +11,7 @@ from tests import get_tests_output_path
 from TTS.tts.configs import BaseTTSConfig
 from TTS.tts.datasets import TTSDataset
 from TTS.tts.datasets.preprocess import ljspeech
+from TTS.tts.utils.data import collate_glow_tts
 from TTS.utils.audio import AudioProcessor
 
 # pylint: disable=unused-variable
@@ -94,6 +96,37 @@ class TestTTSDataset(unittest.TestCase):
                     assert mel_input.max() <= self.ap.max_norm
                     assert mel_input.min() >= 0
 
+    def test_collate_glow_tts(self):
+        if ok_ljspeech:
+            _, dataset = self._create_dataloader(2, 1, 0)
+            speaker_ids = {"ljspeech": 3}
+            collate_fn = functools.partial(collate_glow_tts, collate_fn=dataset.collate_fn, speaker_ids=speaker_ids)
+            dataloader = DataLoader(dataset, batch_size=2, shuffle=False, collate_fn=collate_fn, drop_last=True)
+
+            for i, data in enumerate(dataloader):
+                if i == self.max_loader_iter:
+                    break
+                mel_input = data[4]
+                mel_lengths = data[5]
+                speaker_c = data[10]
+
+                # B x D x T and contiguous in time
+                assert mel_input.shape[0] == 2
+                assert mel_input.shape[1] == c.audio["num_mels"]
+                assert mel_input.shape[2] == mel_lengths.max()
+                assert mel_input.stride(-1) == 1
+                assert mel_input.is_contiguous()
+                # speaker ids appended at the end
+                assert len(data) == 11
+                assert speaker_c.dtype == torch.long
+                assert speaker_c.tolist() == [3, 3]
+
+            # without speaker ids the layout of the dataset is kept
+            collate_fn = functools.partial(collate_glow_tts, collate_fn=dataset.collate_fn)
+            data = collate_fn([dataset[0], dataset[1]])
+            assert len(data) == 10
+            assert data[4].shape[1] == c.audio["num_mels"]
+
     def test_batch_group_shuffle(self):
         if ok_ljspeech:
             dataloader, dataset = self._create_dataloader(2, c.r, 16)
@@ -0,0 +1,38 @@
+import unittest
+
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+from TTS.utils.training import CUDAPrefetcher
+
+
+def _format_data(data):
+    inputs, targets = data
+    return inputs.cuda(non_blocking=True), targets.cuda(non_blocking=True), [1, 2]
+
+
+@unittest.skipIf(not torch.cuda.is_available(), "CUDAPrefetcher requires CUDA.")
+class TestCUDAPrefetcher(unittest.TestCase):
+    def test_all_batches_in_order(self):
+        inputs = torch.arange(10).float()
+        targets = torch.arange(10) * 2
+        data_loader = DataLoader(TensorDataset(inputs, targets), batch_size=3, shuffle=False)
+
+        batches = list(CUDAPrefetcher(data_loader, _format_data))
+        assert len(batches) == len(data_loader)
+        for batch, (ref_inputs, ref_targets) in zip(batches, data_loader):
+            assert batch[0].is_cuda and batch[1].is_cuda
+            assert torch.equal(batch[0].cpu(), ref_inputs)
+            assert torch.equal(batch[1].cpu(), ref_targets)
+            assert batch[2] == [1, 2]
+
+    def test_stops_cleanly(self):
+        data_loader = DataLoader(TensorDataset(torch.arange(4).float(), torch.arange(4)), batch_size=2)
+        prefetcher = CUDAPrefetcher(data_loader, _format_data)
+        assert len(list(prefetcher)) == 2
+        with self.assertRaises(StopIteration):
+            next(prefetcher)
+
+    def test_empty_loader(self):
+        data_loader = DataLoader(TensorDataset(torch.zeros(0), torch.zeros(0)), batch_size=2)
+        assert not list(CUDAPrefetcher(data_loader, _format_data))
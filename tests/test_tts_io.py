@@ -0,0 +1,95 @@
+import os
+import shutil
+import unittest
+
+import torch
+from torch import nn
+
+from tests import get_tests_output_path
+from TTS.tts.utils.io import copy_state_dict_to_cpu, load_checkpoint, save_checkpoint
+from TTS.utils.radam import RAdam
+
+OUTPATH = os.path.join(get_tests_output_path(), "tts_io_tests/")
+
+
+class DummyModel(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.encoder = nn.Linear(4, 8)
+        self.decoder = nn.Linear(8, 2)
+
+    def forward(self, x):
+        return self.decoder(torch.relu(self.encoder(x)))
+
+
+def _train_step(model, optimizer):
+    optimizer.zero_grad()
+    model(torch.randn(3, 4)).sum().backward()
+    optimizer.step()
+
+
+class TestCopyStateDictToCPU(unittest.TestCase):
+    def test_nested_copy(self):
+        state = {"a": torch.ones(2), "b": [torch.zeros(1), (torch.ones(1), 3)], "c": "text"}
+        state_copy = copy_state_dict_to_cpu(state)
+        assert isinstance(state_copy["b"], list)
+        assert isinstance(state_copy["b"][1], tuple)
+        assert state_copy["b"][1][1] == 3
+        assert state_copy["c"] == "text"
+
+        state["a"].add_(1)
+        state["b"][0].add_(1)
+        state["b"][1][0].add_(1)
+        assert torch.equal(state_copy["a"], torch.ones(2))
+        assert torch.equal(state_copy["b"][0], torch.zeros(1))
+        assert torch.equal(state_copy["b"][1][0], torch.ones(1))
+        # containers are copied too
+        state["b"].append(1)
+        assert len(state_copy["b"]) == 2
+
+    def test_independent_of_training_updates(self):
+        model = DummyModel()
+        optimizer = RAdam(model.parameters(), lr=0.1)
+        _train_step(model, optimizer)
+
+        model_state = copy_state_dict_to_cpu(model.state_dict())
+        optimizer_state = copy_state_dict_to_cpu(optimizer.state_dict())
+        ref_weight = model.decoder.weight.detach().clone()
+        ref_exp_avg = optimizer.state[model.decoder.weight]["exp_avg"].clone()
+
+        _train_step(model, optimizer)
+        assert not torch.equal(model.decoder.weight, ref_weight)
+        assert torch.equal(model_state["decoder.weight"], ref_weight)
+        param_idx = next(idx for idx, param in enumerate(model.parameters()) if param is model.decoder.weight)
+        assert torch.equal(optimizer_state["state"][param_idx]["exp_avg"], ref_exp_avg)
+        assert optimizer_state["state"][param_idx]["step"] == 1
+
+
+class TestSaveCheckpointFromStateDict(unittest.TestCase):
+    def setUp(self):
+        os.makedirs(OUTPATH, exist_ok=True)
+
+    def tearDown(self):
+        shutil.rmtree(OUTPATH, ignore_errors=True)
+
+    def test_round_trip(self):
+        model = DummyModel()
+        optimizer = RAdam(model.parameters(), lr=0.1)
+        _train_step(model, optimizer)
+
+        model_state = copy_state_dict_to_cpu(model.state_dict())
+        optimizer_state = copy_state_dict_to_cpu(optimizer.state_dict())
+        save_checkpoint(model_state, optimizer_state, 10, 1, 1, OUTPATH, "abc", model_loss=0.5)
+
+        new_model = DummyModel()
+        new_model, state = load_checkpoint(new_model, os.path.join(OUTPATH, "checkpoint_10.pth.tar"))
+        for key, value in model.state_dict().items():
+            assert torch.equal(new_model.state_dict()[key], value)
+        assert state["step"] == 10
+        assert state["epoch"] == 1
+        assert state["characters"] == "abc"
+        assert state["model_loss"] == 0.5
+
+        new_optimizer = RAdam(new_model.parameters(), lr=0.1)
+        new_optimizer.load_state_dict(state["optimizer"])
+        assert new_optimizer.state_dict()["state"].keys() == optimizer.state_dict()["state"].keys()